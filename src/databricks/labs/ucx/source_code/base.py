@@ -138,8 +138,13 @@ class Linter:
 
 class PythonLinter(Linter):
 
+    # inference embeds the session state into the tree (see InferredValue._contextualize),
+    # so it is part of the parse cache identity; subclasses that infer with a session
+    # state set this in their constructor
+    _session_state: CurrentSessionState | None = None
+
     def lint(self, code: str) -> Iterable[Advice]:
-        tree = Tree.normalize_and_parse(code)
+        tree = Tree.normalize_and_parse_cached(code, self._session_state)
         yield from self.lint_tree(tree)
 
     @abstractmethod
@@ -1,3 +1,4 @@
+import re
 from abc import ABC, abstractmethod
 from collections.abc import Iterable, Iterator
 from dataclasses import dataclass
@@ -14,7 +15,7 @@ from databricks.labs.ucx.source_code.base import (
 )
 from databricks.labs.ucx.source_code.linters.python_infer import InferredValue
 from databricks.labs.ucx.source_code.queries import FromTable
-from databricks.labs.ucx.source_code.linters.python_ast import Tree, TreeHelper
+from databricks.labs.ucx.source_code.linters.python_ast import P_CALL, Tree, TreeHelper
 
 
 @dataclass
@@ -28,10 +29,11 @@ class Matcher(ABC):
     session_state: CurrentSessionState | None = None
 
     def matches(self, node: NodeNG):
+        # cheapest checks first, resolving the module walks the assignment chain
         return (
             isinstance(node, Call)
-            and self._get_table_arg(node) is not None
             and isinstance(node.func, Attribute)
+            and self._get_table_arg(node) is not None
             and Tree(node.func.expr).is_from_module("spark")
         )
 
@@ -59,19 +61,22 @@ class Matcher(ABC):
         return None
 
     def _check_call_context(self, node: Call) -> bool:
-        assert isinstance(node.func, Attribute)  # Avoid linter warning
-        func_name = node.func.attrname
-        qualified_name = TreeHelper.get_full_function_name(node)
-
-        # Check if the call_context is None as that means all calls are checked
+        # Check if the call_context is None as that means all calls are checked,
+        # without paying for the full dotted-name resolution below
         if self.call_context is None:
             return True
 
-        # Get the qualified names from the call_context dictionary
-        qualified_names = self.call_context.get(func_name)
+        assert isinstance(node.func, Attribute)  # Avoid linter warning
 
-        # Check if the qualified name is in the set of qualified names that are allowed
-        return qualified_name in qualified_names if qualified_names else False
+        # Get the qualified names from the call_context dictionary, the trailing
+        # attribute is the cheapest and most selective check
+        qualified_names = self.call_context.get(node.func.attrname)
+        if not qualified_names:
+            return False
+
+        # Only now is resolving the full dotted name worth it, as it walks the attribute chain
+        qualified_name = TreeHelper.get_full_function_name(node)
+        return qualified_name in qualified_names
 
 
 @dataclass
@@ -118,7 +123,6 @@ class TableNameMatcher(Matcher):
         self, from_table: FromTable, index: MigrationIndex, session_state: CurrentSessionState, node: Call
     ) -> Iterator[Advice]:
         table_arg = self._get_table_arg(node)
-        table_name = table_arg.as_string().strip("'").strip('"')
         for inferred in InferredValue.infer_from_node(table_arg, session_state):
             if not inferred.is_inferred():
                 yield Advisory.from_node(
@@ -130,6 +134,7 @@ class TableNameMatcher(Matcher):
             dst = self._find_dest(index, inferred.as_string(), from_table.schema)
             if dst is None:
                 continue
+            table_name = table_arg.as_string().strip("'").strip('"')
             yield Deprecation.from_node(
                 code='table-migrated-to-uc',
                 message=f"Table {table_name} is migrated to {dst.destination()} in Unity Catalog",
@@ -178,24 +183,15 @@ class ReturnValueMatcher(Matcher):
 
 @dataclass
 class DirectFilesystemAccessMatcher(Matcher):
-    _DIRECT_FS_REFS = {
-        "s3a://",
-        "s3n://",
-        "s3://",
-        "wasb://",
-        "wasbs://",
-        "abfs://",
-        "abfss://",
-        "dbfs:/",
-        "hdfs://",
-        "file:/",
-    }
+    # one pass over the literal instead of a prefix probe per scheme;
+    # dbfs and file intentionally already match with a single slash
+    _DIRECT_FS_REF = re.compile(r"^(?:s3[an]?|wasbs?|abfss?|hdfs)://|^(?:dbfs|file):/")
 
     def matches(self, node: NodeNG):
         return (
             isinstance(node, Call)
-            and self._get_table_arg(node) is not None
             and isinstance(node.func, Attribute)
+            and self._get_table_arg(node) is not None
             and (Tree(node.func.expr).is_from_module("spark") or Tree(node.func.expr).is_from_module("dbutils"))
         )
 
@@ -209,7 +205,7 @@ class DirectFilesystemAccessMatcher(Matcher):
             return
         if not isinstance(table_arg.value, str):
             return
-        if any(table_arg.value.startswith(prefix) for prefix in self._DIRECT_FS_REFS):
+        if self._DIRECT_FS_REF.match(table_arg.value):
             yield Deprecation.from_node(
                 code='direct-filesystem-access',
                 message=f"The use of direct filesystem references is deprecated: {table_arg.value}",
@@ -331,17 +327,29 @@ class SparkSql(PythonLinter, Fixer):
 
     _spark_matchers = SparkMatchers()
 
+    # every matcher requires a call chain that resolves to one of these names,
+    # so sources lacking both tokens can't yield any advice
+    _fast_triggers = ("spark", "dbutils")
+
     def __init__(self, from_table: FromTable, index: MigrationIndex, session_state):
         self._from_table = from_table
         self._index = index
         self._session_state = session_state
+        # dispatch on the trailing attribute name is a single dict lookup per Call node
+        self._matcher_by_name: dict[str, Matcher] = self._spark_matchers.matchers
 
     def name(self) -> str:
         # this is the same fixer, just in a different language context
         return self._from_table.name()
 
+    def lint(self, code: str) -> Iterable[Advice]:
+        # a C-level substring scan is far cheaper than parsing with astroid
+        if not any(trigger in code for trigger in self._fast_triggers):
+            return
+        yield from super().lint(code)
+
     def lint_tree(self, tree: Tree) -> Iterable[Advice]:
-        for node in tree.walk():
+        for node in tree.walk(P_CALL):
             matcher = self._find_matcher(node)
             if matcher is None:
                 continue
@@ -349,9 +357,12 @@ class SparkSql(PythonLinter, Fixer):
             yield from matcher.lint(self._from_table, self._index, self._session_state, node)
 
     def apply(self, code: str) -> str:
+        # fixing mutates the tree, so it needs a private parse: the cached lint trees
+        # stay aliased by not-yet-consumed lint generators and may hold contextualized
+        # nodes that can't be serialized back to source
         tree = Tree.parse(code)
         # we won't be doing it like this in production, but for the sake of the example
-        for node in tree.walk():
+        for node in tree.walk(P_CALL):
             matcher = self._find_matcher(node)
             if matcher is None:
                 continue
@@ -364,7 +375,7 @@ class SparkSql(PythonLinter, Fixer):
             return None
         if not isinstance(node.func, Attribute):
             return None
-        matcher = self._spark_matchers.matchers.get(node.func.attrname, None)
+        matcher = self._matcher_by_name.get(node.func.attrname, None)
         if matcher is None:
             return None
         return matcher if matcher.matches(node) else None
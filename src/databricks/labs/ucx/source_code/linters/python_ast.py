@@ -3,8 +3,10 @@ from __future__ import annotations
 from abc import ABC
 import logging
 import re
-from collections.abc import Iterable
+from collections.abc import Iterable, MutableMapping
+from functools import lru_cache
 from typing import TypeVar, cast
+from weakref import WeakKeyDictionary
 
 from astroid import (  # type: ignore
     Assign,
@@ -26,6 +28,37 @@ logger = logging.getLogger(__name__)
 missing_handlers: set[str] = set()
 
 
+class _IdentityKey:
+    """Compares and hashes by wrapped-object identity, keeping the object alive while cached"""
+
+    __slots__ = ("_value",)
+
+    def __init__(self, value: object):
+        self._value = value
+
+    def __eq__(self, other):
+        return isinstance(other, _IdentityKey) and other._value is self._value
+
+    def __hash__(self):
+        return id(self._value)
+
+
+@lru_cache(maxsize=1024)
+def _parse_normalized(code: str, _state_key: _IdentityKey | None) -> Module:
+    return parse(code)
+
+
+# node-kind patterns used to prune subtrees that cannot contain a relevant node,
+# see Tree.walk and TreeHelper.subtree_patterns
+P_CALL = 1
+P_CONST_STR = 2
+P_ATTRIBUTE = 4
+
+_subtree_patterns: MutableMapping[NodeNG, int] = WeakKeyDictionary()
+
+_full_function_names: MutableMapping[Call, str | None] = WeakKeyDictionary()
+
+
 T = TypeVar("T", bound=NodeNG)
 
 
@@ -42,6 +75,19 @@ class Tree:
         root = parse(code)
         return Tree(root)
 
+    @classmethod
+    def normalize_and_parse_cached(cls, code: str, session_state: object | None = None) -> Tree:
+        """Parse normalized code, reusing the astroid tree when the same source was parsed before.
+
+        The returned tree shares its nodes across calls, so it is only safe for read-only
+        usage such as linting; use normalize_and_parse for trees that get fixed, appended
+        or renumbered. Inference may embed the session state into the tree (see
+        InferredValue._contextualize), so the state takes part in the cache identity and
+        the same source linted under another session state gets its own tree.
+        """
+        state_key = _IdentityKey(session_state) if session_state is not None else None
+        return Tree(_parse_normalized(cls.normalize(code), state_key))
+
     @classmethod
     def normalize(cls, code: str):
         code = cls._normalize_indents(code)
@@ -91,6 +137,7 @@ class Tree:
 
     def __init__(self, node: NodeNG):
         self._node: NodeNG = node
+        self._first_statement: NodeNG | None = None
 
     @property
     def node(self):
@@ -103,14 +150,18 @@ class Tree:
             node = node.parent
         return node
 
-    def walk(self) -> Iterable[NodeNG]:
-        yield from self._walk(self._node)
+    def walk(self, patterns: int = 0) -> Iterable[NodeNG]:
+        """Yield all nodes, depth-first; when patterns is non-zero, skip subtrees
+        whose precomputed node-kind mask can't intersect it, see P_CALL and friends."""
+        yield from self._walk(self._node, patterns)
 
     @classmethod
-    def _walk(cls, node: NodeNG) -> Iterable[NodeNG]:
+    def _walk(cls, node: NodeNG, patterns: int = 0) -> Iterable[NodeNG]:
+        if patterns and not TreeHelper.subtree_patterns(node) & patterns:
+            return
         yield node
         for child in node.get_children():
-            yield from cls._walk(child)
+            yield from cls._walk(child, patterns)
 
     def locate(self, node_type: type[T], match_nodes: list[tuple[str, type]]) -> list[T]:
         visitor = MatchingVisitor(node_type, match_nodes)
@@ -118,10 +169,11 @@ class Tree:
         return visitor.matched_nodes
 
     def first_statement(self):
-        if isinstance(self._node, Module):
-            if len(self._node.body) > 0:
-                return self._node.body[0]
-        return None
+        # memoized on the instance, as lint and apply both request it repeatedly;
+        # appending statements can't change the result once a first statement exists
+        if self._first_statement is None and isinstance(self._node, Module) and len(self._node.body) > 0:
+            self._first_statement = self._node.body[0]
+        return self._first_statement
 
     def __repr__(self):
         truncate_after = 32
@@ -249,6 +301,24 @@ class Tree:
 
 class TreeHelper(ABC):
 
+    @classmethod
+    def subtree_patterns(cls, node: NodeNG) -> int:
+        """Compute the OR-ed node-kind mask of a subtree, memoized per node"""
+        patterns = _subtree_patterns.get(node)
+        if patterns is not None:
+            return patterns
+        patterns = 0
+        if isinstance(node, Call):
+            patterns |= P_CALL
+        elif isinstance(node, Attribute):
+            patterns |= P_ATTRIBUTE
+        elif isinstance(node, Const) and isinstance(node.value, str):
+            patterns |= P_CONST_STR
+        for child in node.get_children():
+            patterns |= cls.subtree_patterns(child)
+        _subtree_patterns[node] = patterns
+        return patterns
+
     @classmethod
     def extract_call_by_name(cls, call: Call, name: str) -> Call | None:
         """Given a call-chain, extract its sub-call by method name (if it has one)"""
@@ -312,27 +382,47 @@ class TreeHelper(ABC):
     def get_full_function_name(cls, node: Call) -> str | None:
         if not isinstance(node, Call):
             return None
+        try:
+            # lint and apply both resolve the same Call nodes, so memoize per node
+            return _full_function_names[node]
+        except KeyError:
+            pass
         if isinstance(node.func, Attribute):
-            return cls._get_attribute_value(node.func)
-        if isinstance(node.func, Name):
-            return node.func.name
-        return None
+            name = cls._get_attribute_value(node.func)
+        elif isinstance(node.func, Name):
+            name = node.func.name
+        else:
+            name = None
+        _full_function_names[node] = name
+        return name
 
     @classmethod
     def _get_attribute_value(cls, node: Attribute):
-        if isinstance(node.expr, Name):
-            return node.expr.name + '.' + node.attrname
-        if isinstance(node.expr, Attribute):
-            parent = cls._get_attribute_value(node.expr)
-            return node.attrname if parent is None else parent + '.' + node.attrname
-        if isinstance(node.expr, Call):
-            name = cls.get_full_function_name(node.expr)
-            return node.attrname if name is None else name + '.' + node.attrname
-        name = type(node.expr).__name__
-        if name not in missing_handlers:
-            missing_handlers.add(name)
-            logger.debug(f"Missing handler for {name}")
-        return None
+        # iterate instead of recursing, collecting attribute names from the outside in,
+        # so deep chains cost neither stack frames nor quadratic string concatenation
+        parts: list[str] = []
+        current: NodeNG = node
+        while isinstance(current, Attribute):
+            parts.append(current.attrname)
+            expr = current.expr
+            if isinstance(expr, Call):
+                # walk up intermediate calls such as spark.range(...)
+                current = expr.func
+                continue
+            if not isinstance(expr, (Name, Attribute)):
+                name = type(expr).__name__
+                if name not in missing_handlers:
+                    missing_handlers.add(name)
+                    logger.debug(f"Missing handler for {name}")
+                # the chain can't be resolved below this attribute, so drop it
+                parts.pop()
+                break
+            current = expr
+        if isinstance(current, Name):
+            parts.append(current.name)
+        if not parts:
+            return None
+        return '.'.join(reversed(parts))
 
 
 class TreeVisitor:
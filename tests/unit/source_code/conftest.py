@@ -12,12 +12,15 @@ from databricks.labs.ucx.source_code.path_lookup import PathLookup
 from databricks.labs.ucx.source_code.python_libraries import PythonLibraryResolver
 
 
-@pytest.fixture
+# the index fixtures are session-scoped because MigrationIndex is immutable once built
+
+
+@pytest.fixture(scope='session')
 def empty_index():
     return MigrationIndex([])
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def migration_index():
     return MigrationIndex(
         [
@@ -27,7 +30,7 @@ def migration_index():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def extended_test_index():
     return MigrationIndex(
         [
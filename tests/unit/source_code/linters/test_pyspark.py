@@ -8,51 +8,49 @@ from databricks.labs.ucx.source_code.linters.pyspark import TableNameMatcher, Sp
 from databricks.labs.ucx.source_code.queries import FromTable
 
 
-def test_spark_no_sql(empty_index):
+@pytest.fixture(scope='module')
+def sqf_empty(empty_index):
     session_state = CurrentSessionState()
-    ftf = FromTable(empty_index, session_state)
-    sqf = SparkSql(ftf, empty_index, session_state)
+    return SparkSql(FromTable(empty_index, session_state), empty_index, session_state)
 
-    assert not list(sqf.lint("print(1)"))
 
+@pytest.fixture(scope='module')
+def sqf_migration(migration_index):
+    session_state = CurrentSessionState()
+    return SparkSql(FromTable(migration_index, session_state), migration_index, session_state)
+
+
+def test_spark_no_sql(sqf_empty):
+    # any() stops at the first advice, so the no-match path stays lazy end-to-end
+    assert not any(sqf_empty.lint("print(1)"))
 
-def test_spark_dynamic_sql(empty_index):
+
+def test_spark_dynamic_sql(sqf_empty):
     source = """
 schema="some_schema"
 df4.write.saveAsTable(f"{schema}.member_measure")
 """
-    session_state = CurrentSessionState()
-    ftf = FromTable(empty_index, session_state)
-    sqf = SparkSql(ftf, empty_index, session_state)
-    assert not list(sqf.lint(source))
+    assert not any(sqf_empty.lint(source))
 
 
-def test_spark_sql_no_match(empty_index):
-    session_state = CurrentSessionState()
-    ftf = FromTable(empty_index, session_state)
-    sqf = SparkSql(ftf, empty_index, session_state)
-
+def test_spark_sql_no_match(sqf_empty):
     old_code = """
 for i in range(10):
     result = spark.sql("SELECT * FROM old.things").collect()
     print(len(result))
 """
 
-    assert not list(sqf.lint(old_code))
+    assert not any(sqf_empty.lint(old_code))
 
 
-def test_spark_sql_match(migration_index):
-    session_state = CurrentSessionState()
-    ftf = FromTable(migration_index, session_state)
-    sqf = SparkSql(ftf, migration_index, session_state)
-
+def test_spark_sql_match(sqf_migration):
     old_code = """
 spark.read.csv("s3://bucket/path")
 for i in range(10):
     result = spark.sql("SELECT * FROM old.things").collect()
     print(len(result))
 """
-    assert list(sqf.lint(old_code)) == [
+    assert list(sqf_migration.lint(old_code)) == [
         Deprecation(
             code='direct-filesystem-access',
             message='The use of direct filesystem references is deprecated: s3://bucket/path',
@@ -72,18 +70,14 @@ for i in range(10):
     ]
 
 
-def test_spark_sql_match_named(migration_index):
-    session_state = CurrentSessionState()
-    ftf = FromTable(migration_index, session_state)
-    sqf = SparkSql(ftf, migration_index, session_state)
-
+def test_spark_sql_match_named(sqf_migration):
     old_code = """
 spark.read.csv("s3://bucket/path")
 for i in range(10):
     result = spark.sql(args=[1], sqlQuery = "SELECT * FROM old.things").collect()
     print(len(result))
 """
-    assert list(sqf.lint(old_code)) == [
+    assert list(sqf_migration.lint(old_code)) == [
         Deprecation(
             code='direct-filesystem-access',
             message='The use of direct filesystem references is deprecated: ' 's3://bucket/path',
@@ -103,29 +97,22 @@ for i in range(10):
     ]
 
 
-def test_spark_table_return_value_apply(migration_index):
-    session_state = CurrentSessionState()
-    ftf = FromTable(migration_index, session_state)
-    sqf = SparkSql(ftf, migration_index, session_state)
+def test_spark_table_return_value_apply(sqf_migration):
     old_code = """spark.read.csv('s3://bucket/path')
 for table in spark.catalog.listTables():
     do_stuff_with_table(table)"""
-    fixed_code = sqf.apply(old_code)
+    fixed_code = sqf_migration.apply(old_code)
     # no transformations to apply, only lint messages
     assert fixed_code.rstrip() == old_code.rstrip()
 
 
-def test_spark_sql_fix(migration_index):
-    session_state = CurrentSessionState()
-    ftf = FromTable(migration_index, session_state)
-    sqf = SparkSql(ftf, migration_index, session_state)
-
+def test_spark_sql_fix(sqf_migration):
     old_code = """spark.read.csv("s3://bucket/path")
 for i in range(10):
     result = spark.sql("SELECT * FROM old.things").collect()
     print(len(result))
 """
-    fixed_code = sqf.apply(old_code)
+    fixed_code = sqf_migration.apply(old_code)
     assert (
         fixed_code.rstrip()
         == """spark.read.csv('s3://bucket/path')
@@ -135,6 +122,21 @@ for i in range(10):
     )
 
 
+def test_spark_sql_lint_reflects_current_session_state(migration_index):
+    # inference embeds the session state into the tree, so linting the same code
+    # under another session state must not reuse a previously contextualized parse
+    code = """
+name = dbutils.widgets.get('table_name')
+spark.table(name)
+"""
+    for table_name, destination in (('old.things', 'brand.new.stuff'), ('other.matters', 'some.certain.issues')):
+        session_state = CurrentSessionState(named_parameters={'table_name': table_name})
+        sqf = SparkSql(FromTable(migration_index, session_state), migration_index, session_state)
+        advices = list(sqf.lint(code))
+        assert [advice.code for advice in advices] == ['table-migrated-to-uc']
+        assert destination in advices[0].message
+
+
 @pytest.mark.parametrize(
     "code, expected",
     [
@@ -539,11 +541,8 @@ for i in range(10):
         ),
     ],
 )
-def test_spark_cloud_direct_access(empty_index, code, expected):
-    session_state = CurrentSessionState()
-    ftf = FromTable(empty_index, session_state)
-    sqf = SparkSql(ftf, empty_index, session_state)
-    advisories = list(sqf.lint(code))
+def test_spark_cloud_direct_access(sqf_empty, code, expected):
+    advisories = list(sqf_empty.lint(code))
     assert advisories == expected
 
 
@@ -559,14 +558,10 @@ FS_FUNCTIONS = [
 
 
 @pytest.mark.parametrize("fs_function", FS_FUNCTIONS)
-def test_direct_cloud_access_reports_nothing(empty_index, fs_function):
-    session_state = CurrentSessionState()
-    ftf = FromTable(empty_index, session_state)
-    sqf = SparkSql(ftf, empty_index, session_state)
+def test_direct_cloud_access_reports_nothing(sqf_empty, fs_function):
     # ls function calls have to be from dbutils.fs, or we ignore them
     code = f"""spark.{fs_function}("/bucket/path")"""
-    advisories = list(sqf.lint(code))
-    assert not advisories
+    assert not any(sqf_empty.lint(code))
 
 
 def test_get_full_function_name_for_member_function():
@@ -1,7 +1,7 @@
 import pytest
 from astroid import Assign, AstroidSyntaxError, Attribute, Call, Const, Expr, Name  # type: ignore
 
-from databricks.labs.ucx.source_code.linters.python_ast import Tree, TreeHelper
+from databricks.labs.ucx.source_code.linters.python_ast import P_CALL, P_CONST_STR, Tree, TreeHelper
 from databricks.labs.ucx.source_code.linters.python_infer import InferredValue
 
 
@@ -223,3 +223,30 @@ df.write.format("delta").saveAsTable("old.things")
 def test_counts_lines(source: str, line_count: int):
     tree = Tree.normalize_and_parse(source)
     assert tree.line_count() == line_count
+
+
+def test_computes_subtree_patterns():
+    tree = Tree.parse("o.m1('hi')\nx = 42")
+    assert TreeHelper.subtree_patterns(tree.node) & P_CALL
+    assert TreeHelper.subtree_patterns(tree.node) & P_CONST_STR
+    assign = tree.node.body[1]
+    assert isinstance(assign, Assign)
+    assert not TreeHelper.subtree_patterns(assign) & (P_CALL | P_CONST_STR)
+
+
+def test_walk_skips_subtrees_without_requested_patterns():
+    tree = Tree.parse("o.m1()\nx = 42")
+    nodes = list(tree.walk(P_CALL))
+    assert any(isinstance(node, Call) for node in nodes)
+    assert not any(isinstance(node, Assign) for node in nodes)
+
+
+def test_fixing_does_not_poison_cached_parse():
+    code = "o.m1('hi')"
+    Tree.normalize_and_parse_cached(code)
+    mutable = Tree.parse(code)
+    stmt = mutable.first_statement()
+    assert isinstance(stmt, Expr)
+    assert isinstance(stmt.value, Call)
+    stmt.value.args[0].value = 'bye'
+    assert Tree.normalize_and_parse_cached(code).node.as_string().rstrip() == "o.m1('hi')"